@@ -13,7 +13,7 @@ from databricks.labs.ucx.account import WorkspaceInfo
 from databricks.labs.ucx.config import WorkspaceConfig
 from databricks.labs.ucx.framework.utils import escape_sql_identifier
 from databricks.labs.ucx.hive_metastore import TablesCrawler
-from databricks.labs.ucx.hive_metastore.tables import Table
+from databricks.labs.ucx.hive_metastore.tables import Table, What
 
 logger = logging.getLogger(__name__)
 
@@ -118,7 +118,7 @@ class TableMapping:
         except BadRequest as err:
             logger.error(err)
 
-    def get_tables_to_migrate(self, tables_crawler: TablesCrawler):
+    def get_tables_to_migrate(self, tables_crawler: TablesCrawler, *, what_filter: What | None = None):
         rules = self.load()
         # Getting all the source tables from the rules
         databases_in_scope = self._get_databases_in_scope({rule.src_schema for rule in rules})
@@ -134,6 +134,8 @@ class TableMapping:
             if crawled_tables_keys[rule.as_hms_table_key].is_databricks_dataset:
                 logger.info(f"Table {rule.as_hms_table_key} is a db demo dataset and will not be upgraded")
                 continue
+            if what_filter and crawled_tables_keys[rule.as_hms_table_key].what != what_filter:
+                continue
             tasks.append(
                 partial(self._get_table_in_scope_task, TableToMigrate(crawled_tables_keys[rule.as_hms_table_key], rule))
             )
@@ -1,6 +1,9 @@
 import datetime
+import itertools
 import logging
-from collections import defaultdict
+import sys
+import time
+from collections import Counter, defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass
 from functools import partial
@@ -9,6 +12,7 @@ from databricks.labs.blueprint.installation import Installation
 from databricks.labs.blueprint.parallel import Threads
 from databricks.labs.lsql.backends import SqlBackend, StatementExecutionBackend
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.catalog import SchemaInfo
 
 from databricks.labs.ucx.config import WorkspaceConfig
 from databricks.labs.ucx.framework.crawlers import CrawlerBase
@@ -20,7 +24,7 @@ from databricks.labs.ucx.hive_metastore.tables import MigrationCount, Table, Wha
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MigrationStatus:
     src_schema: str
     src_table: str
@@ -45,6 +49,8 @@ class TablesMigrate:
         self._tm = table_mapping
         self._migration_status_refresher = migration_status_refresher
         self._seen_tables: dict[str, str] = {}
+        self._reverse_seen: dict[str, str] = {}
+        self._workspace_id: int | None = None
 
     @classmethod
     def for_cli(cls, ws: WorkspaceClient, product='ucx'):
@@ -58,11 +64,12 @@ class TablesMigrate:
 
     def migrate_tables(self, *, what: What | None = None):
         self._init_seen_tables()
-        tables_to_migrate = self._tm.get_tables_to_migrate(self._tc)
-        tasks = []
-        for table in tables_to_migrate:
-            if not what or table.src.what == what:
-                tasks.append(partial(self._migrate_table, table.src, table.rule))
+        tables_to_migrate = self._tm.get_tables_to_migrate(self._tc, what_filter=what)
+        tasks = [partial(self._migrate_table, table.src, table.rule) for table in tables_to_migrate]
+        if not tasks:
+            return
+        # fetched once before fanning out, the worker threads only read it
+        self._workspace_id = self._ws.get_workspace_id()
         Threads.strict("migrate tables", tasks)
 
     def _migrate_table(self, src_table: Table, rule: Rule):
@@ -89,7 +96,8 @@ class TablesMigrate:
                 f"SYNC command failed to migrate {src_table.key} to {target_table_key}. Status code: {sync_result.status_code}. Description: {sync_result.description}"
             )
             return False
-        self._backend.execute(src_table.sql_alter_from(rule.as_uc_table_key, self._ws.get_workspace_id()))
+        self._backend.execute(src_table.sql_alter_from(rule.as_uc_table_key, self._workspace_id))
+        self._migration_status_refresher.invalidate_seen()
         return True
 
     def _migrate_dbfs_root_table(self, src_table: Table, rule: Rule):
@@ -98,7 +106,8 @@ class TablesMigrate:
         logger.debug(f"Migrating managed table {src_table.key} to using SQL query: {table_migrate_sql}")
         self._backend.execute(table_migrate_sql)
         self._backend.execute(src_table.sql_alter_to(rule.as_uc_table_key))
-        self._backend.execute(src_table.sql_alter_from(rule.as_uc_table_key, self._ws.get_workspace_id()))
+        self._backend.execute(src_table.sql_alter_from(rule.as_uc_table_key, self._workspace_id))
+        self._migration_status_refresher.invalidate_seen()
         return True
 
     def _migrate_view(self, src_table: Table, rule: Rule):
@@ -107,7 +116,8 @@ class TablesMigrate:
         logger.debug(f"Migrating view {src_table.key} to using SQL query: {table_migrate_sql}")
         self._backend.execute(table_migrate_sql)
         self._backend.execute(src_table.sql_alter_to(rule.as_uc_table_key))
-        self._backend.execute(src_table.sql_alter_from(rule.as_uc_table_key, self._ws.get_workspace_id()))
+        self._backend.execute(src_table.sql_alter_from(rule.as_uc_table_key, self._workspace_id))
+        self._migration_status_refresher.invalidate_seen()
         return True
 
     def _table_already_upgraded(self, target) -> bool:
@@ -125,7 +135,7 @@ class TablesMigrate:
                 continue
             if table and cur_table.name != table:
                 continue
-            if cur_table.key in self._seen_tables.values():
+            if cur_table.key in self._reverse_seen:
                 upgraded_tables.append(cur_table)
         return upgraded_tables
 
@@ -134,12 +144,12 @@ class TablesMigrate:
     ):
         self._init_seen_tables()
         upgraded_tables = self._get_tables_to_revert(schema=schema, table=table)
-        # reverses the _seen_tables dictionary to key by the source table
-        reverse_seen = {v: k for (k, v) in self._seen_tables.items()}
         tasks = []
         for upgraded_table in upgraded_tables:
             if upgraded_table.kind == "VIEW" or upgraded_table.object_type == "EXTERNAL" or delete_managed:
-                tasks.append(partial(self._revert_migrated_table, upgraded_table, reverse_seen[upgraded_table.key]))
+                tasks.append(
+                    partial(self._revert_migrated_table, upgraded_table, self._reverse_seen[upgraded_table.key])
+                )
                 continue
             logger.info(
                 f"Skipping {upgraded_table.object_type} Table {upgraded_table.database}.{upgraded_table.name} "
@@ -153,24 +163,21 @@ class TablesMigrate:
         )
         self._backend.execute(table.sql_unset_upgraded_to())
         self._backend.execute(f"DROP {table.kind} IF EXISTS {target_table_key}")
+        self._migration_status_refresher.invalidate_seen()
 
     def _get_revert_count(self, schema: str | None = None, table: str | None = None) -> list[MigrationCount]:
         self._init_seen_tables()
         upgraded_tables = self._get_tables_to_revert(schema=schema, table=table)
 
-        table_by_database = defaultdict(list)
+        what_count_by_database: dict[str, Counter[What]] = defaultdict(Counter)
         for cur_table in upgraded_tables:
-            table_by_database[cur_table.database].append(cur_table)
-
-        migration_list = []
-        for cur_database, tables in table_by_database.items():
-            what_count: dict[What, int] = {}
-            for current_table in tables:
-                if current_table.upgraded_to is not None:
-                    count = what_count.get(current_table.what, 0)
-                    what_count[current_table.what] = count + 1
-            migration_list.append(MigrationCount(database=cur_database, what_count=what_count))
-        return migration_list
+            what_count = what_count_by_database[cur_table.database]
+            if cur_table.upgraded_to is not None:
+                what_count[cur_table.what] += 1
+        return [
+            MigrationCount(database=database, what_count=dict(what_count))
+            for database, what_count in what_count_by_database.items()
+        ]
 
     def is_upgraded(self, schema: str, table: str) -> bool:
         return self._migration_status_refresher.is_upgraded(schema, table)
@@ -180,65 +187,71 @@ class TablesMigrate:
         if not migrated_count:
             logger.info("No migrated tables were found.")
             return False
-        print("The following is the count of migrated tables and views found in scope:")
-        table_header = "Database            |"
-        headers = 1
-        for what in list(What):
-            headers = max(headers, len(what.name.split("_")))
-            table_header += f" {what.name.split('_')[0]:<10} |"
-        print(table_header)
+        whats = list(What)
+        what_names = [what.name.split("_") for what in whats]
+        headers = max((len(name) for name in what_names), default=1)
+        lines = ["The following is the count of migrated tables and views found in scope:"]
+        lines.append("Database            |" + "".join(f" {name[0]:<10} |" for name in what_names))
         # Split the header so _ separated what names are splitted into multiple lines
         for header in range(1, headers):
-            table_sub_header = "                    |"
-            for what in list(What):
-                if len(what.name.split("_")) - 1 < header:
-                    table_sub_header += f"{' '*12}|"
-                    continue
-                table_sub_header += f" {what.name.split('_')[header]:<10} |"
-            print(table_sub_header)
-        separator = "=" * (22 + 13 * len(What))
-        print(separator)
+            sub_header = "".join(
+                f" {name[header]:<10} |" if len(name) > header else f"{' '*12}|" for name in what_names
+            )
+            lines.append("                    |" + sub_header)
+        separator = "=" * (22 + 13 * len(whats))
+        lines.append(separator)
         for count in migrated_count:
-            table_row = f"{count.database:<20}|"
-            for what in list(What):
-                table_row += f" {count.what_count.get(what, 0):10} |"
-            print(table_row)
-        print(separator)
-        print("The following actions will be performed")
-        print("- Migrated External Tables and Views (targets) will be deleted")
+            lines.append(f"{count.database:<20}|" + "".join(f" {count.what_count.get(what, 0):10} |" for what in whats))
+        lines.append(separator)
+        lines.append("The following actions will be performed")
+        lines.append("- Migrated External Tables and Views (targets) will be deleted")
         if delete_managed:
-            print("- Migrated DBFS Root Tables will be deleted")
+            lines.append("- Migrated DBFS Root Tables will be deleted")
         else:
-            print("- Migrated DBFS Root Tables will be left intact")
-            print("To revert and delete Migrated Tables, add --delete_managed true flag to the command")
+            lines.append("- Migrated DBFS Root Tables will be left intact")
+            lines.append("To revert and delete Migrated Tables, add --delete_managed true flag to the command")
+        sys.stdout.write("\n".join(lines) + "\n")
         return True
 
     def _init_seen_tables(self):
         self._seen_tables = self._migration_status_refresher.get_seen_tables()
+        # reverses the _seen_tables dictionary to key by the source table
+        self._reverse_seen = {v: k for (k, v) in self._seen_tables.items()}
 
 
 class MigrationStatusRefresher(CrawlerBase[MigrationStatus]):
+    # seconds a seen tables scan is reused for, long enough to span the lookups of one migrate or revert run
+    SEEN_TABLES_TTL = 300.0
+
     def __init__(self, ws: WorkspaceClient, sbe: SqlBackend, schema, table_crawler: TablesCrawler):
         super().__init__(sbe, "hive_metastore", schema, "migration_status", MigrationStatus)
         self._ws = ws
         self._table_crawler = table_crawler
+        self._seen_cache: tuple[float, dict[str, str]] | None = None
 
     def snapshot(self) -> Iterable[MigrationStatus]:
         return self._snapshot(self._try_fetch, self._crawl)
 
     def get_seen_tables(self) -> dict[str, str]:
-        seen_tables: dict[str, str] = {}
-        for schema in self._iter_schemas():
-            for table in self._ws.tables.list(catalog_name=schema.catalog_name, schema_name=schema.name):
-                if not table.properties:
-                    continue
-                if "upgraded_from" not in table.properties:
-                    continue
-                if not table.full_name:
-                    logger.warning(f"The table {table.name} in {schema.name} has no full name")
-                    continue
-                seen_tables[table.full_name.lower()] = table.properties["upgraded_from"].lower()
-        return seen_tables
+        if self._seen_cache is not None:
+            cached_at, cached_tables = self._seen_cache
+            if time.monotonic() - cached_at < self.SEEN_TABLES_TTL:
+                return dict(cached_tables)
+        workspace_id = str(self._ws.get_workspace_id())
+        tasks = []
+        for schema in self._list_all_schemas():
+            if not schema.catalog_name or not schema.name:
+                continue
+            tasks.append(partial(self._list_upgraded_tables, workspace_id, schema.catalog_name, schema.name))
+        # schemas finish in any order, sort so that duplicate upgraded_from values always resolve the same way
+        upgraded_tables = itertools.chain.from_iterable(Threads.strict("listing upgraded tables", tasks))
+        seen_tables = dict(sorted(upgraded_tables))
+        self._seen_cache = (time.monotonic(), seen_tables)
+        return dict(seen_tables)
+
+    def invalidate_seen(self):
+        """Forces the next call to `get_seen_tables` to re-scan the workspace."""
+        self._seen_cache = None
 
     def is_upgraded(self, schema: str, table: str) -> bool:
         result = self._backend.fetch(f"SHOW TBLPROPERTIES {escape_sql_identifier(schema+'.'+table)}")
@@ -252,25 +265,50 @@ class MigrationStatusRefresher(CrawlerBase[MigrationStatus]):
     def _crawl(self) -> Iterable[MigrationStatus]:
         all_tables = self._table_crawler.snapshot()
         reverse_seen = {v: k for k, v in self.get_seen_tables().items()}
-        timestamp = datetime.datetime.now(datetime.timezone.utc).timestamp()
+        update_ts = str(datetime.datetime.now(datetime.timezone.utc).timestamp())
         for table in all_tables:
-            table_migration_status = MigrationStatus(
-                src_schema=table.database,
-                src_table=table.name,
-                update_ts=str(timestamp),
-            )
-            if table.key in reverse_seen and self.is_upgraded(table.database, table.name):
-                target_table = reverse_seen[table.key]
-                if len(target_table.split(".")) == 3:
-                    table_migration_status.dst_catalog = target_table.split(".")[0]
-                    table_migration_status.dst_schema = target_table.split(".")[1]
-                    table_migration_status.dst_table = target_table.split(".")[2]
-            yield table_migration_status
+            target_table = reverse_seen[table.key].split(".") if table.key in reverse_seen else []
+            if len(target_table) == 3:
+                dst_catalog, dst_schema, dst_table = target_table
+                yield MigrationStatus(
+                    src_schema=table.database,
+                    src_table=table.name,
+                    dst_catalog=dst_catalog,
+                    dst_schema=dst_schema,
+                    dst_table=dst_table,
+                    update_ts=update_ts,
+                )
+                continue
+            yield MigrationStatus(src_schema=table.database, src_table=table.name, update_ts=update_ts)
 
     def _try_fetch(self) -> Iterable[MigrationStatus]:
         for row in self._fetch(f"SELECT * FROM {self._schema}.{self._table}"):
             yield MigrationStatus(*row)
 
-    def _iter_schemas(self):
+    def _list_upgraded_tables(self, workspace_id: str, catalog_name: str, schema_name: str) -> list[tuple[str, str]]:
+        upgraded_tables = []
+        for table in self._ws.tables.list(catalog_name=catalog_name, schema_name=schema_name):
+            if not table.properties:
+                continue
+            if "upgraded_from" not in table.properties:
+                continue
+            # the metastore is shared across workspaces, skip tables upgraded from another workspace's hive_metastore
+            upgraded_from_ws = table.properties.get(Table.UPGRADED_FROM_WS_PARAM)
+            if upgraded_from_ws is not None and upgraded_from_ws != workspace_id:
+                continue
+            if not table.full_name:
+                logger.warning(f"The table {table.name} in {schema_name} has no full name")
+                continue
+            upgraded_tables.append((table.full_name.lower(), table.properties["upgraded_from"].lower()))
+        return upgraded_tables
+
+    def _list_schemas(self, catalog_name: str) -> list[SchemaInfo]:
+        return list(self._ws.schemas.list(catalog_name=catalog_name))
+
+    def _list_all_schemas(self) -> list[SchemaInfo]:
+        tasks = []
         for catalog in self._ws.catalogs.list():
-            yield from self._ws.schemas.list(catalog_name=catalog.name)
+            if not catalog.name:
+                continue
+            tasks.append(partial(self._list_schemas, catalog.name))
+        return list(itertools.chain.from_iterable(Threads.strict("listing schemas", tasks)))
@@ -11,7 +11,7 @@ from databricks.sdk.service.catalog import TableInfo
 
 from databricks.labs.ucx.account import WorkspaceInfo
 from databricks.labs.ucx.hive_metastore.mapping import Rule, TableMapping
-from databricks.labs.ucx.hive_metastore.tables import Table, TablesCrawler
+from databricks.labs.ucx.hive_metastore.tables import Table, TablesCrawler, What
 
 MANAGED_DELTA_TABLE = Table(
     object_type="MANAGED",
@@ -564,6 +564,26 @@ def test_skipping_rules_target_exists():
     assert len(table_mapping.get_tables_to_migrate(tables_crawler)) == 1
 
 
+def test_tables_to_migrate_filtered_by_what():
+    client = create_autospec(WorkspaceClient)
+    client.workspace.download.return_value = io.BytesIO(
+        "workspace_name,catalog_name,src_schema,dst_schema,src_table,dst_table\r\n"
+        "fake_ws,cat1,test_schema1,schema1,test_table1,test_table1\r\n"
+        "fake_ws,cat1,test_schema1,schema1,test_view1,test_view1\r\n".encode("utf8")
+    )
+    tables_crawler = create_autospec(TablesCrawler)
+    tables_crawler.snapshot.return_value = [EXTERNAL_DELTA_TABLE, VIEW]
+    backend = MockBackend()
+    client.tables.get.side_effect = NotFound()
+
+    installation = Installation(client, "ucx")
+    table_mapping = TableMapping(installation, client, backend)
+
+    tables_to_migrate = table_mapping.get_tables_to_migrate(tables_crawler, what_filter=What.VIEW)
+    assert [table_to_migrate.src for table_to_migrate in tables_to_migrate] == [VIEW]
+    client.tables.get.assert_called_once_with("cat1.schema1.test_view1")
+
+
 def test_is_target_exists():
     errors = {}
     rows = {}
@@ -60,6 +60,8 @@ def test_migrate_dbfs_root_tables_should_produce_proper_queries(ws):
     assert "SYNC TABLE ucx_default.db1_dst.managed_other FROM hive_metastore.db1_src.managed_other;" in list(
         backend.queries
     )
+    # one lookup for the seen tables scan and one for the migration run, not one per migrated table
+    assert ws.get_workspace_id.call_count == 2
 
 
 def test_migrate_dbfs_root_tables_should_be_skipped_when_upgrading_external(ws):
@@ -67,12 +69,14 @@ def test_migrate_dbfs_root_tables_should_be_skipped_when_upgrading_external(ws):
     rows = {}
     backend = MockBackend(fails_on_first=errors, rows=rows)
     table_crawler = TablesCrawler(backend, "inventory_database")
-    table_mapping = table_mapping_mock(["managed_dbfs"])
+    table_mapping = table_mapping_mock()
     migration_status_refresher = MigrationStatusRefresher(ws, backend, "inventory_database", table_crawler)
     table_migrate = TablesMigrate(table_crawler, ws, backend, table_mapping, migration_status_refresher)
     table_migrate.migrate_tables(what=What.EXTERNAL_SYNC)
 
-    assert len(backend.queries) == 0
+    table_mapping.get_tables_to_migrate.assert_called_once_with(table_crawler, what_filter=What.EXTERNAL_SYNC)
+    # only the seen tables scan looks the workspace id up when there is nothing to migrate
+    ws.get_workspace_id.assert_called_once()
 
 
 def test_migrate_external_tables_should_produce_proper_queries(ws):
@@ -387,11 +391,7 @@ def test_table_status():
 
     datetime.datetime = FakeDate
     errors = {}
-    rows = {
-        "SHOW TBLPROPERTIES schema1.table1": [
-            {"key": "upgraded_to", "value": "cat1.schema1.dest1"},
-        ],
-    }
+    rows = {}
     backend = MockBackend(fails_on_first=errors, rows=rows)
     table_crawler = create_autospec(TablesCrawler)
     table_crawler.snapshot.return_value = [
@@ -424,6 +424,7 @@ def test_table_status():
         ),
     ]
     client = workspace_client_mock()
+    client.get_workspace_id.return_value = 12345
     client.catalogs.list.return_value = [CatalogInfo(name="cat1")]
     client.schemas.list.return_value = [
         SchemaInfo(catalog_name="cat1", name="schema1"),
@@ -434,18 +435,19 @@ def test_table_status():
             schema_name="schema1",
             name="table1",
             full_name="cat1.schema1.table1",
-            properties={"upgraded_from": "hive_metastore.schema1.table1"},
+            properties={"upgraded_from": "hive_metastore.schema1.table1", Table.UPGRADED_FROM_WS_PARAM: "12345"},
         ),
         TableInfo(
             catalog_name="cat1",
             schema_name="schema1",
             name="table2",
             full_name="cat1.schema1.table2",
-            properties={"upgraded_from": "hive_metastore.schema1.table2"},
+            properties={"upgraded_from": "hive_metastore.schema1.table2", Table.UPGRADED_FROM_WS_PARAM: "67890"},
         ),
     ]
     table_status_crawler = MigrationStatusRefresher(client, backend, "ucx", table_crawler)
     snapshot = list(table_status_crawler.snapshot())
+    assert not [query for query in backend.queries if query.startswith("SHOW TBLPROPERTIES")]
     assert snapshot == [
         MigrationStatus(
             src_schema='schema1',
@@ -539,3 +541,87 @@ def test_table_status_seen_tables():
         'cat1.schema1.table2': 'hive_metastore.schema1.table2',
         'cat1.schema1.table3': 'hive_metastore.schema1.table3',
     }
+
+
+def test_table_status_seen_tables_from_other_workspace():
+    backend = MockBackend()
+    table_crawler = create_autospec(TablesCrawler)
+    client = create_autospec(WorkspaceClient)
+    client.get_workspace_id.return_value = 12345
+    client.catalogs.list.return_value = [CatalogInfo(name="cat1")]
+    client.schemas.list.return_value = [
+        SchemaInfo(catalog_name="cat1", name="schema1"),
+    ]
+    client.tables.list.return_value = [
+        TableInfo(
+            catalog_name="cat1",
+            schema_name="schema1",
+            name="table1",
+            full_name="cat1.schema1.table1",
+            properties={"upgraded_from": "hive_metastore.schema1.table1", Table.UPGRADED_FROM_WS_PARAM: "12345"},
+        ),
+        TableInfo(
+            catalog_name="cat1",
+            schema_name="schema1",
+            name="table2",
+            full_name="cat1.schema1.table2",
+            properties={"upgraded_from": "hive_metastore.schema1.table2", Table.UPGRADED_FROM_WS_PARAM: "67890"},
+        ),
+    ]
+    table_status_crawler = MigrationStatusRefresher(client, backend, "ucx", table_crawler)
+    seen_tables = table_status_crawler.get_seen_tables()
+    assert seen_tables == {'cat1.schema1.table1': 'hive_metastore.schema1.table1'}
+
+
+def test_table_status_seen_tables_cached():
+    backend = MockBackend()
+    table_crawler = create_autospec(TablesCrawler)
+    client = create_autospec(WorkspaceClient)
+    client.catalogs.list.return_value = [CatalogInfo(name="cat1")]
+    client.schemas.list.return_value = [
+        SchemaInfo(catalog_name="cat1", name="schema1"),
+    ]
+    client.tables.list.return_value = [
+        TableInfo(
+            catalog_name="cat1",
+            schema_name="schema1",
+            name="table1",
+            full_name="cat1.schema1.table1",
+            properties={"upgraded_from": "hive_metastore.schema1.table1"},
+        ),
+    ]
+    table_status_crawler = MigrationStatusRefresher(client, backend, "ucx", table_crawler)
+    first = table_status_crawler.get_seen_tables()
+    second = table_status_crawler.get_seen_tables()
+    assert first == second == {'cat1.schema1.table1': 'hive_metastore.schema1.table1'}
+    client.tables.list.assert_called_once()
+
+    first.clear()
+    assert table_status_crawler.get_seen_tables() == {'cat1.schema1.table1': 'hive_metastore.schema1.table1'}
+
+    table_status_crawler.invalidate_seen()
+    table_status_crawler.get_seen_tables()
+    assert client.tables.list.call_count == 2
+
+
+def test_table_status_seen_tables_sorted():
+    backend = MockBackend()
+    table_crawler = create_autospec(TablesCrawler)
+    client = create_autospec(WorkspaceClient)
+    client.catalogs.list.return_value = [CatalogInfo(name="cat1")]
+    client.schemas.list.return_value = [
+        SchemaInfo(catalog_name="cat1", name="schema2"),
+        SchemaInfo(catalog_name="cat1", name="schema1"),
+    ]
+    client.tables.list.side_effect = lambda catalog_name, schema_name: [
+        TableInfo(
+            catalog_name=catalog_name,
+            schema_name=schema_name,
+            name="table1",
+            full_name=f"{catalog_name}.{schema_name}.table1",
+            properties={"upgraded_from": "hive_metastore.schema1.table1"},
+        ),
+    ]
+    table_status_crawler = MigrationStatusRefresher(client, backend, "ucx", table_crawler)
+    seen_tables = table_status_crawler.get_seen_tables()
+    assert list(seen_tables) == ['cat1.schema1.table1', 'cat1.schema2.table1']
@@ -1,11 +1,10 @@
 import io
 import json
-import subprocess
-from unittest.mock import create_autospec, patch
+import shutil
+from unittest.mock import MagicMock, create_autospec, patch
 
 import pytest
 import yaml
-from databricks.labs.blueprint.installation import Installation
 from databricks.labs.blueprint.tui import MockPrompts
 from databricks.sdk import AccountClient, WorkspaceClient
 from databricks.sdk.errors import NotFound
@@ -41,48 +40,107 @@ from databricks.labs.ucx.cli import (
     workflows,
 )
 
-
-@pytest.fixture
-def ws():
-    state = {
-        "/Users/foo/.ucx/config.yml": yaml.dump(
-            {
-                'version': 2,
-                'inventory_database': 'ucx',
-                'warehouse_id': 'test',
-                'connect': {
-                    'host': 'foo',
-                    'token': 'bar',
-                },
-            }
-        ),
-        '/Users/foo/.ucx/state.json': json.dumps({'resources': {'jobs': {'assessment': '123'}}}),
-        "/Users/foo/.ucx/uc_roles_access.csv": "role_arn,resource_type,privilege,resource_path\n"
-        "arn:aws:iam::123456789012:role/role_name,s3,READ_FILES,s3://labsawsbucket/",
-        "/Users/foo/.ucx/azure_storage_account_info.csv": "prefix,client_id,principal,privilege,type,directory_id\ntest,test,test,test,Application,test",
-        "/Users/foo/.ucx/mapping.csv": "workspace_name,catalog_name,src_schema,dst_schema,src_table,dst_table\ntest,test,test,test,test,test",
+_CONFIG_YML = yaml.dump(
+    {
+        'version': 2,
+        'inventory_database': 'ucx',
+        'warehouse_id': 'test',
+        'connect': {
+            'host': 'foo',
+            'token': 'bar',
+        },
     }
+)
+_STATE_JSON = json.dumps({'resources': {'jobs': {'assessment': '123'}}})
+_STATE: dict[str, str | bytes] = {
+    "/Users/foo/.ucx/config.yml": _CONFIG_YML,
+    '/Users/foo/.ucx/state.json': _STATE_JSON,
+    "/Users/foo/.ucx/uc_roles_access.csv": b"role_arn,resource_type,privilege,resource_path\n"
+    b"arn:aws:iam::123456789012:role/role_name,s3,READ_FILES,s3://labsawsbucket/",
+    "/Users/foo/.ucx/azure_storage_account_info.csv": b"prefix,client_id,principal,privilege,type,directory_id\ntest,test,test,test,Application,test",
+    "/Users/foo/.ucx/mapping.csv": b"workspace_name,catalog_name,src_schema,dst_schema,src_table,dst_table\ntest,test,test,test,test,test",
+}
+
+# MockPrompts only holds the compiled patterns, so the common instances are shared across tests
+_PROMPTS_EMPTY = MockPrompts({})
+_PROMPTS_YES = MockPrompts({'.*': 'yes'})
+_PROMPTS_NO = MockPrompts({'.*': 'no'})
+_CLUSTER_PROMPTS = MockPrompts({"Please provide the cluster id's as comma separated value from the above list.*": "1"})
+
+_CLUSTERS = [
+    ClusterDetails(cluster_id="123", cluster_name="test_cluster", cluster_source=ClusterSource.UI),
+    ClusterDetails(cluster_id="1234", cluster_name="test_cluster1", cluster_source=ClusterSource.JOB),
+]
+
+# pylint: disable-next=consider-using-namedtuple-or-dataclass
+_CLOUD_CONFIGS = {
+    "azure": {"is_azure": True, "is_aws": False, "is_gcp": False, "auth_type": "azure-cli"},
+    "azure-cli-missing": {"is_azure": True, "is_aws": False, "is_gcp": False, "auth_type": "azure_clis"},
+    "aws": {"is_azure": False, "is_aws": True, "is_gcp": False, "auth_type": "pat"},
+    "gcp": {"is_azure": False, "is_aws": False, "is_gcp": True, "auth_type": "pat"},
+}
+
+_EXECUTE_STATEMENT_RESPONSE = sql.ExecuteStatementResponse(
+    status=sql.StatementStatus(state=sql.StatementState.SUCCEEDED),
+    manifest=sql.ResultManifest(schema=sql.ResultSchema()),
+    statement_id='123',
+)
+
+
+class _FakePopen:
+    returncode = 127
 
-    def download(path: str) -> io.StringIO | io.BytesIO:
-        if path not in state:
-            raise NotFound(path)
-        if ".csv" in path:
-            return io.BytesIO(state[path].encode('utf-8'))
-        return io.StringIO(state[path])
+    def __init__(self, *_, **__):
+        pass
 
-    workspace_client = create_autospec(WorkspaceClient)
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return None
+
+    def communicate(self):
+        return b"message", b"error"
+
+
+def _download(path: str) -> io.StringIO | io.BytesIO:
+    if path not in _STATE:
+        raise NotFound(path)
+    content = _STATE[path]
+    if isinstance(content, bytes):
+        return io.BytesIO(content)
+    return io.StringIO(content)
+
+
+@pytest.fixture
+def ws():
+    workspace_client = create_autospec(WorkspaceClient, instance=True)
     workspace_client.get_workspace_id.return_value = 123
     workspace_client.config.host = 'https://localhost'
-    workspace_client.current_user.me().user_name = "foo"
-    workspace_client.workspace.download = download
-    workspace_client.statement_execution.execute_statement.return_value = sql.ExecuteStatementResponse(
-        status=sql.StatementStatus(state=sql.StatementState.SUCCEEDED),
-        manifest=sql.ResultManifest(schema=sql.ResultSchema()),
-        statement_id='123',
-    )
+    workspace_client.current_user.me.return_value.user_name = "foo"
+    workspace_client.workspace.download = _download
+    workspace_client.statement_execution.execute_statement.return_value = _EXECUTE_STATEMENT_RESPONSE
     return workspace_client
 
 
+def _set_cloud(workspace_client, name: str):
+    for attribute, value in _CLOUD_CONFIGS[name].items():
+        setattr(workspace_client.config, attribute, value)
+
+
+@pytest.fixture
+def cloud(ws, request):
+    _set_cloud(ws, request.param)
+    return request.param
+
+
+@pytest.fixture
+def aws_cli_available(monkeypatch, request):
+    aws_cli = getattr(request, "param", "/path/aws")
+    monkeypatch.setattr(shutil, "which", lambda _: aws_cli)
+    return aws_cli
+
+
 def test_workflow(ws, caplog):
     workflows(ws)
     assert "Fetching deployed jobs..." in caplog.messages
@@ -138,17 +196,17 @@ def test_skip_no_schema(ws, caplog):
 
 
 def test_sync_workspace_info():
-    a = create_autospec(AccountClient)
+    a = MagicMock(spec=AccountClient)
     sync_workspace_info(a)
     a.workspaces.list.assert_called()
 
 
 def test_create_account_groups():
-    a = create_autospec(AccountClient)
-    w = create_autospec(WorkspaceClient)
+    a = MagicMock(spec=AccountClient)
+    w = create_autospec(WorkspaceClient, instance=True)
     a.get_workspace_client.return_value = w
     w.get_workspace_id.return_value = None
-    prompts = MockPrompts({})
+    prompts = _PROMPTS_EMPTY
     create_account_groups(a, prompts, new_workspace_client=lambda: w)
     a.groups.list.assert_called_with(attributes="id")
 
@@ -164,7 +222,7 @@ def test_create_table_mapping(ws):
 
 
 def test_validate_external_locations(ws):
-    validate_external_locations(ws, MockPrompts({}))
+    validate_external_locations(ws, _PROMPTS_EMPTY)
 
     ws.statement_execution.execute_statement.assert_called()
 
@@ -188,65 +246,55 @@ def test_no_step_in_repair_run(ws):
 
 def test_revert_migrated_tables(ws, caplog):
     # test with no schema and no table, user confirm to not retry
-    prompts = MockPrompts({'.*': 'no'})
+    prompts = _PROMPTS_NO
     assert revert_migrated_tables(ws, prompts, schema=None, table=None) is None
 
     # test with no schema and no table, user confirm to retry, but no ucx installation found
-    prompts = MockPrompts({'.*': 'yes'})
+    prompts = _PROMPTS_YES
     assert revert_migrated_tables(ws, prompts, schema=None, table=None) is None
     assert 'No migrated tables were found.' in caplog.messages
 
 
-def test_move_no_catalog(ws, caplog):
-    prompts = MockPrompts({})
-    move(ws, prompts, "", "", "", "", "")
-
-    assert 'Please enter from_catalog and to_catalog details' in caplog.messages
-
-
-def test_move_same_schema(ws, caplog):
-    prompts = MockPrompts({})
-    move(ws, prompts, "SrcCat", "SrcS", "*", "SrcCat", "SrcS")
-
-    assert 'please select a different schema or catalog to migrate to' in caplog.messages
-
-
-def test_move_no_schema(ws, caplog):
-    prompts = MockPrompts({})
-    move(ws, prompts, "SrcCat", "", "*", "TgtCat", "")
+@pytest.mark.parametrize(
+    "args,expected_msg",
+    [
+        (("", "", "", "", ""), 'Please enter from_catalog and to_catalog details'),
+        (("SrcCat", "SrcS", "*", "SrcCat", "SrcS"), 'please select a different schema or catalog to migrate to'),
+        (
+            ("SrcCat", "", "*", "TgtCat", ""),
+            'Please enter from_schema, to_schema and from_table (enter * for migrating all tables) details.',
+        ),
+    ],
+)
+def test_move_invalid_arguments(ws, caplog, args, expected_msg):
+    prompts = _PROMPTS_EMPTY
+    move(ws, prompts, *args)
 
-    assert (
-        'Please enter from_schema, to_schema and from_table (enter * for migrating all tables) details.'
-        in caplog.messages
-    )
+    assert expected_msg in caplog.messages
 
 
 def test_move(ws):
-    prompts = MockPrompts({'.*': 'yes'})
+    prompts = _PROMPTS_YES
     move(ws, prompts, "SrcC", "SrcS", "*", "TgtC", "ToS")
 
     ws.tables.list.assert_called_once()
 
 
-def test_alias_no_catalog(ws, caplog):
-    alias(ws, "", "", "", "", "")
-
-    assert "Please enter from_catalog and to_catalog details" in caplog.messages
-
-
-def test_alias_same_schema(ws, caplog):
-    alias(ws, "SrcCat", "SrcS", "*", "SrcCat", "SrcS")
-
-    assert 'please select a different schema or catalog to migrate to' in caplog.messages
-
-
-def test_alias_no_schema(ws, caplog):
-    alias(ws, "SrcCat", "", "*", "TgtCat", "")
+@pytest.mark.parametrize(
+    "args,expected_msg",
+    [
+        (("", "", "", "", ""), "Please enter from_catalog and to_catalog details"),
+        (("SrcCat", "SrcS", "*", "SrcCat", "SrcS"), 'please select a different schema or catalog to migrate to'),
+        (
+            ("SrcCat", "", "*", "TgtCat", ""),
+            'Please enter from_schema, to_schema and from_table (enter * for migrating all tables) details.',
+        ),
+    ],
+)
+def test_alias_invalid_arguments(ws, caplog, args, expected_msg):
+    alias(ws, *args)
 
-    assert (
-        'Please enter from_schema, to_schema and from_table (enter * for migrating all tables) details.'
-        in caplog.messages
-    )
+    assert expected_msg in caplog.messages
 
 
 def test_alias(ws):
@@ -255,30 +303,25 @@ def test_alias(ws):
     ws.tables.list.assert_called_once()
 
 
-def test_save_storage_and_principal_azure_no_azure_cli(ws, caplog):
-    ws.config.auth_type = "azure_clis"
-    ws.config.is_azure = True
-    prompts = MockPrompts({})
-    principal_prefix_access(ws, prompts, "")
-
-    assert 'In order to obtain AAD token, Please run azure cli to authenticate.' in caplog.messages
-
-
-def test_save_storage_and_principal_azure_no_subscription_id(ws, caplog):
-    ws.config.auth_type = "azure-cli"
-    ws.config.is_azure = True
-
-    prompts = MockPrompts({})
-    principal_prefix_access(ws, prompts)
+@pytest.mark.parametrize(
+    "cloud,subscription_id,expected_msg",
+    [
+        ("azure-cli-missing", "", 'In order to obtain AAD token, Please run azure cli to authenticate.'),
+        ("azure", None, "Please enter subscription id to scan storage accounts in."),
+    ],
+    indirect=["cloud"],
+)
+def test_save_storage_and_principal_azure_invalid_setup(ws, cloud, caplog, subscription_id, expected_msg):
+    prompts = _PROMPTS_EMPTY
+    principal_prefix_access(ws, prompts, subscription_id)
 
-    assert "Please enter subscription id to scan storage accounts in." in caplog.messages
+    assert expected_msg in caplog.messages
 
 
-def test_save_storage_and_principal_azure(ws, caplog):
-    ws.config.auth_type = "azure-cli"
-    ws.config.is_azure = True
-    prompts = MockPrompts({})
-    azure_resource_permissions = create_autospec(AzureResourcePermissions)
+def test_save_storage_and_principal_azure(ws):
+    _set_cloud(ws, "azure")
+    prompts = _PROMPTS_EMPTY
+    azure_resource_permissions = create_autospec(AzureResourcePermissions, instance=True)
     principal_prefix_access(ws, prompts, subscription_id="test", azure_resource_permissions=azure_resource_permissions)
     azure_resource_permissions.save_spn_permissions.assert_called_once()
 
@@ -288,85 +331,66 @@ def test_validate_groups_membership(ws):
     ws.groups.list.assert_called()
 
 
-def test_save_storage_and_principal_aws_no_profile(ws, caplog, mocker):
-    mocker.patch("shutil.which", return_value="/path/aws")
-    ws.config.is_azure = False
-    ws.config.is_aws = True
-    prompts = MockPrompts({})
+def test_save_storage_and_principal_aws_no_profile(ws, caplog, aws_cli_available):
+    _set_cloud(ws, "aws")
+    prompts = _PROMPTS_EMPTY
     principal_prefix_access(ws, prompts)
     assert any({"AWS Profile is not specified." in message for message in caplog.messages})
 
 
-def test_save_storage_and_principal_aws_no_connection(ws, mocker):
-    mocker.patch("shutil.which", return_value="/path/aws")
-    pop = create_autospec(subprocess.Popen)
-    ws.config.is_azure = False
-    ws.config.is_aws = True
-    pop.communicate.return_value = (bytes("message", "utf-8"), bytes("error", "utf-8"))
-    pop.returncode = 127
-    mocker.patch("subprocess.Popen.__init__", return_value=None)
-    mocker.patch("subprocess.Popen.__enter__", return_value=pop)
-    mocker.patch("subprocess.Popen.__exit__", return_value=None)
-    prompts = MockPrompts({})
+def test_save_storage_and_principal_aws_no_connection(ws, mocker, aws_cli_available):
+    _set_cloud(ws, "aws")
+    mocker.patch("subprocess.Popen", _FakePopen)
+    prompts = _PROMPTS_EMPTY
 
     with pytest.raises(ResourceWarning, match="AWS CLI is not configured properly."):
         principal_prefix_access(ws, prompts, aws_profile="profile")
 
 
-def test_save_storage_and_principal_aws_no_cli(ws, mocker, caplog):
-    mocker.patch("shutil.which", return_value=None)
-    ws.config.is_azure = False
-    ws.config.is_aws = True
-    prompts = MockPrompts({})
+@pytest.mark.parametrize("aws_cli_available", [None], indirect=True)
+def test_save_storage_and_principal_aws_no_cli(ws, caplog, aws_cli_available):
+    _set_cloud(ws, "aws")
+    prompts = _PROMPTS_EMPTY
     principal_prefix_access(ws, prompts, aws_profile="profile")
     assert any({"Couldn't find AWS" in message for message in caplog.messages})
 
 
-def test_save_storage_and_principal_aws(ws, mocker, caplog):
-    mocker.patch("shutil.which", return_value=True)
-    ws.config.is_azure = False
-    ws.config.is_aws = True
-    aws_resource_permissions = create_autospec(AWSResourcePermissions)
-    prompts = MockPrompts({})
+def test_save_storage_and_principal_aws(ws, aws_cli_available):
+    _set_cloud(ws, "aws")
+    aws_resource_permissions = create_autospec(AWSResourcePermissions, instance=True)
+    prompts = _PROMPTS_EMPTY
     principal_prefix_access(ws, prompts, aws_profile="profile", aws_resource_permissions=aws_resource_permissions)
     aws_resource_permissions.save_instance_profile_permissions.assert_called_once()
 
 
 def test_save_storage_and_principal_gcp(ws, caplog):
-    ws.config.is_azure = False
-    ws.config.is_aws = False
-    ws.config.is_gcp = True
-    prompts = MockPrompts({})
+    _set_cloud(ws, "gcp")
+    prompts = _PROMPTS_EMPTY
     principal_prefix_access(ws, prompts)
     assert "This cmd is only supported for azure and aws workspaces" in caplog.messages
 
 
 def test_migrate_credentials_azure(ws):
-    ws.config.is_azure = True
+    _set_cloud(ws, "azure")
     ws.workspace.upload.return_value = "test"
-    prompts = MockPrompts({'.*': 'yes'})
+    prompts = _PROMPTS_YES
     migrate_credentials(ws, prompts)
     ws.storage_credentials.list.assert_called()
 
 
-def test_migrate_credentials_aws(ws, mocker):
-    mocker.patch("shutil.which", return_value=True)
-    ws.config.is_azure = False
-    ws.config.is_aws = True
-    ws.config.is_gcp = False
-    aws_resources = create_autospec(AWSResources)
+def test_migrate_credentials_aws(ws, aws_cli_available):
+    _set_cloud(ws, "aws")
+    aws_resources = create_autospec(AWSResources, instance=True)
     aws_resources.validate_connection.return_value = {"Account": "123456789012"}
-    prompts = MockPrompts({'.*': 'yes'})
+    prompts = _PROMPTS_YES
     migrate_credentials(ws, prompts, aws_profile="profile", aws_resources=aws_resources)
     ws.storage_credentials.list.assert_called()
     aws_resources.update_uc_trust_role.assert_called_once()
 
 
-def test_migrate_credentials_aws_no_profile(ws, caplog, mocker):
-    mocker.patch("shutil.which", return_value="/path/aws")
-    ws.config.is_azure = False
-    ws.config.is_aws = True
-    prompts = MockPrompts({})
+def test_migrate_credentials_aws_no_profile(ws, caplog, aws_cli_available):
+    _set_cloud(ws, "aws")
+    prompts = _PROMPTS_EMPTY
     migrate_credentials(ws, prompts)
     assert (
         "AWS Profile is not specified. Use the environment variable [AWS_DEFAULT_PROFILE] or use the "
@@ -374,68 +398,42 @@ def test_migrate_credentials_aws_no_profile(ws, caplog, mocker):
     )
 
 
-def test_create_master_principal_not_azure(ws):
-    ws.config.is_azure = False
-    prompts = MockPrompts({})
-    create_uber_principal(ws, prompts, subscription_id="")
-    ws.workspace.get_status.assert_not_called()
-
-
-def test_create_master_principal_no_azure_cli(ws):
-    ws.config.auth_type = "azure_clis"
-    ws.config.is_azure = True
-    prompts = MockPrompts({})
-    create_uber_principal(ws, prompts, subscription_id="")
-    ws.workspace.get_status.assert_not_called()
-
-
-def test_create_master_principal_no_subscription(ws):
-    ws.config.auth_type = "azure-cli"
-    ws.config.is_azure = True
-    prompts = MockPrompts({})
+@pytest.mark.parametrize("cloud", ["aws", "azure-cli-missing", "azure"], indirect=True)
+def test_create_master_principal_skipped(ws, cloud):
+    prompts = _PROMPTS_EMPTY
     create_uber_principal(ws, prompts, subscription_id="")
     ws.workspace.get_status.assert_not_called()
 
 
 def test_create_uber_principal(ws):
-    ws.config.auth_type = "azure-cli"
-    ws.config.is_azure = True
-    prompts = MockPrompts({})
+    _set_cloud(ws, "azure")
+    prompts = _PROMPTS_EMPTY
     with pytest.raises(ValueError):
         create_uber_principal(ws, prompts, subscription_id="12")
 
 
 def test_migrate_locations_azure(ws):
-    ws.config.is_azure = True
-    ws.config.is_aws = False
-    ws.config.is_gcp = False
+    _set_cloud(ws, "azure")
     migrate_locations(ws)
     ws.external_locations.list.assert_called()
 
 
-def test_migrate_locations_aws(ws, caplog, mocker):
-    mocker.patch("shutil.which", return_value=True)
-    ws.config.is_azure = False
-    ws.config.is_aws = True
-    ws.config.is_gcp = False
+def test_migrate_locations_aws(ws, aws_cli_available):
+    _set_cloud(ws, "aws")
     migrate_locations(ws, aws_profile="profile")
     ws.external_locations.list.assert_called()
 
 
-def test_missing_aws_cli(ws, caplog, mocker):
+@pytest.mark.parametrize("aws_cli_available", [None], indirect=True)
+def test_missing_aws_cli(ws, caplog, aws_cli_available):
+    _set_cloud(ws, "aws")
     # Test to verify the CLI is called. Fail it intentionally to test the error message.
-    mocker.patch("shutil.which", return_value=None)
-    ws.config.is_azure = False
-    ws.config.is_aws = True
-    ws.config.is_gcp = False
     migrate_locations(ws, aws_profile="profile")
     assert "Couldn't find AWS CLI in path. Please install the CLI from https://aws.amazon.com/cli/" in caplog.messages
 
 
 def test_migrate_locations_gcp(ws, caplog):
-    ws.config.is_azure = False
-    ws.config.is_aws = False
-    ws.config.is_gcp = True
+    _set_cloud(ws, "gcp")
     migrate_locations(ws)
     assert "migrate_locations is not yet supported in GCP" in caplog.messages
 
@@ -446,40 +444,33 @@ def test_create_catalogs_schemas(ws):
     ws.catalogs.list.assert_called_once()
 
 
-def test_cluster_remap(ws, caplog):
-    prompts = MockPrompts({"Please provide the cluster id's as comma separated value from the above list.*": "1"})
-    ws = create_autospec(WorkspaceClient)
-    ws.clusters.get.return_value = ClusterDetails(cluster_id="123", cluster_name="test_cluster")
-    ws.clusters.list.return_value = [
-        ClusterDetails(cluster_id="123", cluster_name="test_cluster", cluster_source=ClusterSource.UI),
-        ClusterDetails(cluster_id="1234", cluster_name="test_cluster1", cluster_source=ClusterSource.JOB),
-    ]
-    installation = create_autospec(Installation)
-    installation.save.return_value = "a/b/c"
-    cluster_remap(ws, prompts)
+def test_cluster_remap(caplog):
+    prompts = _CLUSTER_PROMPTS
+    workspace_client = create_autospec(WorkspaceClient, instance=True)
+    workspace_client.clusters.get.return_value = ClusterDetails(cluster_id="123", cluster_name="test_cluster")
+    workspace_client.clusters.list.return_value = _CLUSTERS
+    cluster_remap(workspace_client, prompts)
     assert "Remapping the Clusters to UC" in caplog.messages
 
 
-def test_cluster_remap_error(ws, caplog):
-    prompts = MockPrompts({"Please provide the cluster id's as comma separated value from the above list.*": "1"})
-    ws = create_autospec(WorkspaceClient)
-    ws.clusters.list.return_value = []
-    installation = create_autospec(Installation)
-    installation.save.return_value = "a/b/c"
-    cluster_remap(ws, prompts)
+def test_cluster_remap_error(caplog):
+    prompts = _CLUSTER_PROMPTS
+    workspace_client = create_autospec(WorkspaceClient, instance=True)
+    workspace_client.clusters.list.return_value = []
+    cluster_remap(workspace_client, prompts)
     assert "No cluster information present in the workspace" in caplog.messages
 
 
-def test_revert_cluster_remap(ws, caplog, mocker):
-    prompts = MockPrompts({"Please provide the cluster id's as comma separated value from the above list.*": "1"})
-    ws = create_autospec(WorkspaceClient)
-    ws.workspace.list.return_value = [ObjectInfo(path='/ucx/backup/clusters/123.json')]
+def test_revert_cluster_remap():
+    prompts = _CLUSTER_PROMPTS
+    workspace_client = create_autospec(WorkspaceClient, instance=True)
+    workspace_client.workspace.list.return_value = [ObjectInfo(path='/ucx/backup/clusters/123.json')]
     with pytest.raises(TypeError):
-        revert_cluster_remap(ws, prompts)
+        revert_cluster_remap(workspace_client, prompts)
 
 
-def test_revert_cluster_remap_empty(ws, caplog):
-    prompts = MockPrompts({"Please provide the cluster id's as comma separated value from the above list.*": "1"})
-    ws = create_autospec(WorkspaceClient)
-    revert_cluster_remap(ws, prompts)
+def test_revert_cluster_remap_empty(caplog):
+    prompts = _CLUSTER_PROMPTS
+    workspace_client = create_autospec(WorkspaceClient, instance=True)
+    revert_cluster_remap(workspace_client, prompts)
     assert "There is no cluster files in the backup folder. Skipping the reverting process" in caplog.messages